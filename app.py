@@ -1,30 +1,213 @@
-from flask import Flask, request, jsonify, render_template
-from datetime import datetime, timedelta
-import json
+from flask import Flask, request, render_template
+from flask.json.provider import JSONProvider
+from datetime import datetime
 import sqlite3
-from typing import List, Dict, Any
-import re
+from typing import List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import asyncio
+import time
+import importlib.util
+import sys
 import os
 
+import orjson
+
 # LLM Integration Options
-try:
-    from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
-    HF_AVAILABLE = True
-except ImportError:
-    HF_AVAILABLE = False
+# transformers takes seconds to import, so it is only probed here and
+# imported once the HuggingFace method is actually selected
+HF_AVAILABLE = importlib.util.find_spec("transformers") is not None
 
 try:
     import requests as ollama_requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     OLLAMA_AVAILABLE = True
 except ImportError:
     OLLAMA_AVAILABLE = False
 
+from plan_cache import PlanCache, goal_plan_cache, PLAN_CACHE_ENABLED, EMBEDDINGS_AVAILABLE
+from planner_core import extract_timeframe, fallback_plan_generation as _rule_based_plan, MAX_CACHED_GOAL_LENGTH
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Shared by app.json and _json: numpy values from the plan cache serialize
+# natively, and naive datetimes are written as UTC
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+class OrjsonProvider(JSONProvider):
+    '''Serialize API requests and responses with orjson'''
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+def _json(data, status=200):
+    '''Build a JSON response straight from orjson bytes, skipping jsonify'''
+    return app.response_class(
+        orjson.dumps(data, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+
+OLLAMA_URL = 'http://localhost:11434'
+OLLAMA_MODEL = 'llama2'
+
+# Built once at import; filled in per request with the goal and today's date
+_OLLAMA_PROMPT = '''You are a professional project manager. Break down this goal into actionable tasks with realistic timelines and dependencies.
+
+Goal: "%(goal)s"
+
+Please respond with a JSON object in this exact format:
+{
+    "goal": "%(goal)s",
+    "estimated_duration": "X days/weeks",
+    "tasks": [
+        {
+            "id": 1,
+            "title": "Task name",
+            "description": "Detailed description",
+            "estimated_hours": X,
+            "dependencies": [],
+            "deadline": "YYYY-MM-DD",
+            "priority": "High/Medium/Low",
+            "category": "Planning/Development/Testing/Marketing/etc"
+        }
+    ],
+    "timeline": {
+        "start_date": "YYYY-MM-DD",
+        "end_date": "YYYY-MM-DD",
+        "milestones": [
+            {
+                "name": "Milestone name",
+                "date": "YYYY-MM-DD",
+                "tasks_completed": [1, 2, 3]
+            }
+        ]
+    }
+}
+
+Make tasks specific, actionable, and properly sequenced. Use today's date as reference: %(today)s'''
+
+@lru_cache(maxsize=1)
+def _format_day(timestamp: int) -> str:
+    '''Format a whole-second timestamp as a YYYY-MM-DD date'''
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+
+def _today_str() -> str:
+    '''Today's date, formatted at most once per second'''
+    return _format_day(int(time.time()))
+
+# Rule-based plans remembered per (goal, day) by fallback_plan_generation
+FALLBACK_CACHE_SIZE = 1024
+
+# How long a check_ollama_server result is reused before probing again
+OLLAMA_STATUS_TTL = 5.0
+
+# Matches the Ollama server setting so we never queue more work than it runs
+OLLAMA_NUM_PARALLEL = int(os.getenv('OLLAMA_NUM_PARALLEL', '4'))
+
+DB_PATH = 'tasks.db'
+
+# Worker threads for the waitress server started by python app.py --prod
+WAITRESS_THREADS = 8
+
+class _JsonObjectScanner:
+    '''Finds complete top-level JSON objects in text fed in pieces
+
+    Only the text of the object being scanned is kept, so streamed prose
+    around objects is dropped. Braces inside JSON strings are ignored.
+    '''
+
+    def __init__(self):
+        self._parts = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> List[str]:
+        '''Consume more text; returns the text of every object it completes, in order
+
+        Scanning continues past each object, so a candidate that fails to parse
+        does not hide a later one in the same text.
+        '''
+        found = []
+        start = 0 if self._depth else None
+
+        for i, ch in enumerate(text):
+            if self._depth == 0:
+                if ch != '{':
+                    continue
+                start = i
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(text[start:i + 1])
+                    found.append(''.join(self._parts))
+                    self._parts = []
+                    start = None
+
+        if start is not None:
+            self._parts.append(text[start:])
+        return found
+
+# WAL with synchronous=NORMAL fsyncs far less often, at the risk of losing the
+# last commit on power loss. Set SQLITE_WAL=0 to keep SQLite's durable defaults.
+SQLITE_WAL = os.getenv('SQLITE_WAL', '1') != '0'
+
+# Applied once to every pooled connection when it is opened
+SQLITE_PRAGMAS = (
+    ('PRAGMA journal_mode=WAL', 'PRAGMA synchronous=NORMAL') if SQLITE_WAL
+    else ('PRAGMA journal_mode=DELETE', 'PRAGMA synchronous=FULL')
+) + (
+    'PRAGMA temp_store=memory',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+)
 
 class LLMTaskPlanner:
     def __init__(self):
+        self.open_pool()
         self.init_database()
+        self._http = self._create_http_session() if OLLAMA_AVAILABLE else None
+        self._ollama_ok = False
+        self._ollama_checked_at = None
+        self._ollama_check_lock = threading.Lock()
         self.llm_method = self.initialize_llm()
+        self.plan_cache = self.initialize_plan_cache()
+        # Exact repeats of a goal (ignoring case, filler words and word order)
+        self.goal_cache = goal_plan_cache() if self.llm_method == "ollama" else None
+        self._executor = ThreadPoolExecutor(max_workers=OLLAMA_NUM_PARALLEL)
+        # Shared by every request and event loop: at most OLLAMA_NUM_PARALLEL
+        # generations are in flight per process
+        self._ollama_slots = threading.BoundedSemaphore(OLLAMA_NUM_PARALLEL)
+        self._fallback_cache = OrderedDict()
+        self._fallback_cache_lock = threading.Lock()
 
     def initialize_llm(self):
         '''Initialize the best available LLM method'''
@@ -42,6 +225,7 @@ class LLMTaskPlanner:
         # Commenting this out to use enhanced fallback instead
         # elif HF_AVAILABLE:
         #     try:
+        #         from transformers import pipeline
         #         model_name = "microsoft/DialoGPT-medium"
         #         print(f"[INFO] Loading Hugging Face model: {model_name}")
         #         self.hf_generator = pipeline(
@@ -60,155 +244,307 @@ class LLMTaskPlanner:
         print("[INFO] Using enhanced rule-based system (recommended for reliability)")
         return "fallback"
 
+    def initialize_plan_cache(self):
+        '''Load the semantic plan cache when enabled (PLAN_CACHE_ENABLED=1)'''
+
+        # Only LLM output is worth caching; embedding a goal costs more than
+        # running the rule-based generator
+        if not PLAN_CACHE_ENABLED or self.llm_method != "ollama":
+            return None
+
+        if not EMBEDDINGS_AVAILABLE:
+            print("[WARNING] PLAN_CACHE_ENABLED is set but sentence-transformers is not installed")
+            return None
+
+        print("[INFO] Semantic plan cache enabled")
+        return PlanCache(self._conn, self._writer)
+
+    def _create_http_session(self):
+        '''Keep-alive session shared by every Ollama request'''
+        session = ollama_requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        # Only generation is retried; the status probe should fail fast
+        session.mount(f"{OLLAMA_URL}/api/generate", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        ))
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+
     def check_ollama_server(self):
-        '''Check if Ollama server is running'''
+        '''Check if Ollama server is running (cached for OLLAMA_STATUS_TTL seconds)'''
+        # Concurrent callers wait for one probe instead of each hitting Ollama
+        with self._ollama_check_lock:
+            now = time.monotonic()
+            if self._ollama_checked_at is not None and now - self._ollama_checked_at < OLLAMA_STATUS_TTL:
+                return self._ollama_ok
+
+            try:
+                response = self._http.get(f"{OLLAMA_URL}/api/tags", timeout=2)
+                self._ollama_ok = response.status_code == 200
+            except:
+                self._ollama_ok = False
+
+            self._ollama_checked_at = time.monotonic()
+            return self._ollama_ok
+
+    def _connect(self) -> sqlite3.Connection:
+        '''Open a SQLite connection with the pool pragmas applied'''
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def open_pool(self):
+        '''Open the connection pool: one writer plus one reader per CPU'''
+        # The writer is opened first so WAL mode is set before readers attach
+        self._writer_conn = self._connect()
+        self._write_lock = threading.Lock()
+
+        self._readers = queue.Queue()
+        for _ in range(os.cpu_count() or 1):
+            self._readers.put(self._connect())
+
+    @contextmanager
+    def _conn(self):
+        '''Check a read connection out of the pool for the duration of the block'''
+        conn = self._readers.get()
         try:
-            response = ollama_requests.get("http://localhost:11434/api/tags", timeout=2)
-            return response.status_code == 200
-        except:
-            return False
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def _writer(self):
+        '''Hold the single writer connection; SQLite allows one writer at a time'''
+        with self._write_lock:
+            try:
+                yield self._writer_conn
+                self._writer_conn.commit()
+            except Exception:
+                self._writer_conn.rollback()
+                raise
 
     def init_database(self):
         '''Initialize SQLite database for task storage'''
-        conn = sqlite3.connect('tasks.db')
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS task_plans (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                goal TEXT NOT NULL,
-                plan TEXT NOT NULL,
-                llm_method TEXT DEFAULT 'unknown',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        # id is the INTEGER PRIMARY KEY, i.e. the rowid itself, so lookups by
+        # id in get_plan are already a B-tree seek and need no extra index
+        with self._writer() as c:
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS task_plans (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    goal TEXT NOT NULL,
+                    plan TEXT NOT NULL,
+                    llm_method TEXT DEFAULT 'unknown',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
 
     def save_plan(self, goal: str, plan: Dict[str, Any]) -> int:
         '''Save the generated plan to database'''
-        conn = sqlite3.connect('tasks.db')
-        cursor = conn.cursor()
-        cursor.execute(
-            'INSERT INTO task_plans (goal, plan, llm_method) VALUES (?, ?, ?)',
-            (goal, json.dumps(plan), self.llm_method)
-        )
-        plan_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return plan_id
+        with self._writer() as c:
+            cursor = c.execute(
+                'INSERT INTO task_plans (goal, plan, llm_method) VALUES (?, ?, ?)',
+                (goal, orjson.dumps(plan).decode(), self.llm_method)
+            )
+            return cursor.lastrowid
+
+    def save_plans(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[int]:
+        '''Save several (goal, plan) pairs in one transaction and return their ids'''
+        if not items:
+            return []
+
+        with self._writer() as c:
+            c.executemany(
+                'INSERT INTO task_plans (goal, plan, llm_method) VALUES (?, ?, ?)',
+                [(goal, orjson.dumps(plan).decode(), self.llm_method) for goal, plan in items]
+            )
+            # The writer lock keeps the batch contiguous; executemany does not
+            # update cursor.lastrowid, so ask SQLite for the last id directly
+            last_id = c.execute('SELECT last_insert_rowid()').fetchone()[0]
+
+        return list(range(last_id - len(items) + 1, last_id + 1))
 
     def get_plan(self, plan_id: int) -> Dict[str, Any]:
         '''Retrieve a plan from database'''
-        conn = sqlite3.connect('tasks.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM task_plans WHERE id = ?', (plan_id,))
-        result = cursor.fetchone()
-        conn.close()
+        with self._conn() as c:
+            result = c.execute('SELECT * FROM task_plans WHERE id = ?', (plan_id,)).fetchone()
 
         if result:
             return {
                 'id': result[0],
                 'goal': result[1],
-                'plan': json.loads(result[2]),
+                'plan': orjson.loads(result[2]),
                 'llm_method': result[3],
                 'created_at': result[4]
             }
         return None
 
-    def generate_with_ollama(self, goal: str) -> Dict[str, Any]:
-        '''Generate task plan using Ollama local LLM'''
+    def _ollama_request(self, goal: str) -> Dict[str, Any]:
+        '''Build the /api/generate request body for a goal'''
 
-        prompt = f'''You are a professional project manager. Break down this goal into actionable tasks with realistic timelines and dependencies.
+        prompt = _OLLAMA_PROMPT % {'goal': goal, 'today': _today_str()}
 
-Goal: "{goal}"
+        return {
+            "model": OLLAMA_MODEL,
+            "prompt": prompt,
+            "format": "json",
+            "stream": False,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9
+            }
+        }
 
-Please respond with a JSON object in this exact format:
-{{
-    "goal": "{goal}",
-    "estimated_duration": "X days/weeks",
-    "tasks": [
-        {{
-            "id": 1,
-            "title": "Task name",
-            "description": "Detailed description",
-            "estimated_hours": X,
-            "dependencies": [],
-            "deadline": "YYYY-MM-DD",
-            "priority": "High/Medium/Low",
-            "category": "Planning/Development/Testing/Marketing/etc"
-        }}
-    ],
-    "timeline": {{
-        "start_date": "YYYY-MM-DD",
-        "end_date": "YYYY-MM-DD",
-        "milestones": [
-            {{
-                "name": "Milestone name",
-                "date": "YYYY-MM-DD",
-                "tasks_completed": [1, 2, 3]
-            }}
-        ]
-    }}
-}}
+    def warmup(self):
+        '''Do the one-off loading work up front so the first real request is not slow'''
+        if self.llm_method == "ollama":
+            print(f"[INFO] Loading {OLLAMA_MODEL} into Ollama...")
+            try:
+                # A request without a prompt loads the model and returns immediately
+                self._http.post(f"{OLLAMA_URL}/api/generate", json={"model": OLLAMA_MODEL}, timeout=120)
+            except Exception as e:
+                print(f"[WARNING] Ollama warm-up failed: {e}")
 
-Make tasks specific, actionable, and properly sequenced. Use today's date as reference: {datetime.now().strftime("%Y-%m-%d")}'''
+        # Exercises the keyword matcher and templates, which every method falls back to
+        _rule_based_plan("Warm up the planner in 1 week", datetime.now())
 
+    def _parse_ollama_response(self, llm_response: str) -> Optional[Dict[str, Any]]:
+        '''Parse the plan out of the LLM text, or None if there is none'''
+
+        # With format=json the whole response is the plan object
         try:
-            response = ollama_requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": "llama2",
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.7,
-                        "top_p": 0.9
-                    }
-                },
+            plan = orjson.loads(llm_response)
+            if isinstance(plan, dict):
+                return plan
+        except orjson.JSONDecodeError:
+            pass
+
+        # Servers without JSON mode may wrap the object in prose
+        for json_str in _JsonObjectScanner().feed(llm_response):
+            try:
+                return orjson.loads(json_str)
+            except orjson.JSONDecodeError as e:
+                print(f"[WARNING] JSON parsing error: {e}, scanning for another object")
+
+        print("[WARNING] No valid JSON found in LLM response, using fallback")
+        return None
+
+    def _request_ollama_plan(self, goal: str) -> Optional[Dict[str, Any]]:
+        '''Ask Ollama for a plan; returns None when no usable plan came back'''
+        try:
+            response = self._http.post(
+                f"{OLLAMA_URL}/api/generate",
+                json=self._ollama_request(goal),
                 timeout=60
             )
 
             if response.status_code == 200:
                 result = response.json()
-                llm_response = result.get('response', '')
-
-                try:
-                    json_start = llm_response.find('{')
-                    json_end = llm_response.rfind('}') + 1
-
-                    if json_start >= 0 and json_end > json_start:
-                        json_str = llm_response[json_start:json_end]
-                        plan = json.loads(json_str)
-                        return plan
-                    else:
-                        print("[WARNING] No valid JSON found in LLM response, using fallback")
-                        return self.fallback_plan_generation(goal)
-
-                except json.JSONDecodeError as e:
-                    print(f"[WARNING] JSON parsing error: {e}, using fallback")
-                    return self.fallback_plan_generation(goal)
+                return self._parse_ollama_response(result.get('response', ''))
             else:
                 print(f"[WARNING] Ollama API error: {response.status_code}")
-                return self.fallback_plan_generation(goal)
+                return None
 
         except Exception as e:
             print(f"[WARNING] Ollama connection error: {e}")
+            return None
+
+    async def _request_ollama_plan_async(self, goal: str, client) -> Optional[Dict[str, Any]]:
+        '''Stream a plan from Ollama, returning as soon as the JSON object is complete'''
+        scanner = _JsonObjectScanner()
+        try:
+            body = {**self._ollama_request(goal), "stream": True}
+            async with client.stream("POST", "/api/generate", json=body) as response:
+                if response.status_code != 200:
+                    print(f"[WARNING] Ollama API error: {response.status_code}")
+                    return None
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    for json_str in scanner.feed(chunk.get('response', '')):
+                        try:
+                            # Leaving the block closes the stream, which stops generation
+                            return orjson.loads(json_str)
+                        except orjson.JSONDecodeError as e:
+                            print(f"[WARNING] JSON parsing error: {e}, scanning for another object")
+                    if chunk.get('done'):
+                        break
+
+            print("[WARNING] No valid JSON found in LLM response, using fallback")
+            return None
+
+        except Exception as e:
+            print(f"[WARNING] Ollama connection error: {e}")
+            return None
+
+    def _cached_plan(self, goal: str) -> Optional[Dict[str, Any]]:
+        '''Return a cached plan for the same or a similar goal, if any'''
+        total_days = self.extract_timeframe(goal)
+
+        if self.goal_cache is not None:
+            plan = self.goal_cache.lookup(goal, total_days)
+            if plan is not None:
+                print("[INFO] Reusing cached plan for the same goal")
+                return plan
+
+        if self.plan_cache is None:
+            return None
+
+        plan = self.plan_cache.lookup(goal, total_days)
+        if plan is not None:
+            print("[INFO] Reusing cached plan for a similar goal")
+        return plan
+
+    def _remember_plan(self, goal: str, plan: Dict[str, Any]):
+        '''Store an LLM-generated plan in the plan caches'''
+        total_days = self.extract_timeframe(goal)
+        if self.goal_cache is not None:
+            self.goal_cache.store(goal, total_days, plan)
+        if self.plan_cache is not None:
+            self.plan_cache.store(goal, total_days, plan)
+
+    def generate_with_ollama(self, goal: str) -> Dict[str, Any]:
+        '''Generate task plan using Ollama local LLM'''
+        plan = self._cached_plan(goal)
+        if plan is not None:
+            return plan
+
+        with self._ollama_slots:
+            plan = self._request_ollama_plan(goal)
+        if plan is None:
             return self.fallback_plan_generation(goal)
 
-    def extract_timeframe(self, goal: str) -> int:
-        '''Extract time frame from goal text'''
-        time_patterns = [
-            (r'(\d+)\s*weeks?', lambda x: int(x) * 7),
-            (r'(\d+)\s*days?', lambda x: int(x)),
-            (r'(\d+)\s*months?', lambda x: int(x) * 30)
-        ]
+        self._remember_plan(goal, plan)
+        return plan
 
-        for pattern, converter in time_patterns:
-            match = re.search(pattern, goal.lower())
-            if match:
-                return converter(match.group(1))
+    async def generate_with_ollama_async(self, goal: str, client) -> Dict[str, Any]:
+        '''Generate task plan using Ollama without blocking the event loop'''
+        plan = self._cached_plan(goal)
+        if plan is not None:
+            return plan
 
-        return 14  # default 2 weeks
+        # Wait for a slot off the event loop; each Flask async view runs in
+        # its own loop, so an asyncio primitive could not be shared
+        await asyncio.to_thread(self._ollama_slots.acquire)
+        try:
+            plan = await self._request_ollama_plan_async(goal, client)
+        finally:
+            self._ollama_slots.release()
+        if plan is None:
+            return self.fallback_plan_generation(goal)
+
+        self._remember_plan(goal, plan)
+        return plan
+
+    def extract_timeframe(self, goal: str) -> int:
+        '''Extract time frame from goal text'''
+        return extract_timeframe(goal)
 
     def generate_task_plan(self, goal: str) -> Dict[str, Any]:
         '''Generate a comprehensive task plan using the best available LLM method'''
@@ -221,371 +557,66 @@ Make tasks specific, actionable, and properly sequenced. Use today's date as ref
             # Use enhanced fallback for best results
             return self.fallback_plan_generation(goal)
 
+    def generate_task_plans(self, goals: List[str]) -> List[Dict[str, Any]]:
+        '''Generate plans for several goals, running Ollama calls on the worker pool'''
+
+        # The rule-based generator is fast enough that thread hand-off would dominate
+        if self.llm_method != "ollama":
+            return [self.generate_task_plan(goal) for goal in goals]
+
+        futures = [self._executor.submit(self.generate_task_plan, goal) for goal in goals]
+        return [future.result() for future in futures]
+
+    async def generate_task_plans_async(self, goals: List[str]) -> List[Dict[str, Any]]:
+        '''Generate plans for several goals, overlapping the Ollama calls'''
+
+        if self.llm_method != "ollama":
+            return [self.generate_task_plan(goal) for goal in goals]
+
+        if not HTTPX_AVAILABLE:
+            return await asyncio.gather(
+                *[asyncio.wrap_future(self._executor.submit(self.generate_task_plan, goal)) for goal in goals]
+            )
+
+        print(f"[INFO] Generating {len(goals)} plan(s) using: {self.llm_method}")
+
+        # Flask runs each async view in its own event loop, so the client is
+        # scoped to the request and shared by every generation inside it
+        async with httpx.AsyncClient(base_url=OLLAMA_URL, timeout=60) as client:
+            return await asyncio.gather(*[self.generate_with_ollama_async(goal, client) for goal in goals])
+
+    async def generate_task_plan_async(self, goal: str) -> Dict[str, Any]:
+        '''Async counterpart of generate_task_plan used by the API views'''
+        plans = await self.generate_task_plans_async([goal])
+        return plans[0]
+
     def fallback_plan_generation(self, goal: str) -> Dict[str, Any]:
-        '''Enhanced rule-based plan generation with intelligent task breakdown'''
+        '''Rule-based plan for a goal, reused for repeats of the same goal on the same day'''
+        # One timestamp for the key and the plan, so a plan built around
+        # midnight is not stored under the other day's key
+        now = datetime.now()
 
-        total_days = self.extract_timeframe(goal)
-        start_date = datetime.now()
-        end_date = start_date + timedelta(days=total_days)
-
-        goal_lower = goal.lower()
-        tasks = []
-
-        # Product/App Launch Pattern
-        if any(word in goal_lower for word in ['product', 'launch', 'app', 'software', 'platform', 'mobile']):
-            tasks = [
-                {
-                    "id": 1,
-                    "title": "Market Research & User Analysis",
-                    "description": "Conduct comprehensive market research to identify target audience, analyze competitors, and validate product-market fit. Gather user requirements and pain points.",
-                    "estimated_hours": 16,
-                    "dependencies": [],
-                    "deadline": (start_date + timedelta(days=max(1, total_days//7))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Research"
-                },
-                {
-                    "id": 2,
-                    "title": "Product Requirements Documentation",
-                    "description": "Create detailed product requirements document (PRD) including features, user stories, acceptance criteria, and technical specifications. Define MVP scope.",
-                    "estimated_hours": 20,
-                    "dependencies": [1],
-                    "deadline": (start_date + timedelta(days=max(2, total_days//5))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Planning"
-                },
-                {
-                    "id": 3,
-                    "title": "UI/UX Design & Prototyping",
-                    "description": "Design user interface mockups, create wireframes, develop interactive prototypes, and establish design system. Include user flow diagrams and navigation structure.",
-                    "estimated_hours": 32,
-                    "dependencies": [2],
-                    "deadline": (start_date + timedelta(days=max(4, total_days//3))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Design"
-                },
-                {
-                    "id": 4,
-                    "title": "Backend Development & API Implementation",
-                    "description": "Develop server-side logic, create RESTful APIs, implement database schema, set up authentication, and configure cloud infrastructure. Include error handling and logging.",
-                    "estimated_hours": 40,
-                    "dependencies": [2],
-                    "deadline": (start_date + timedelta(days=max(7, int(total_days*0.6)))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Development"
-                },
-                {
-                    "id": 5,
-                    "title": "Frontend Development & Integration",
-                    "description": "Build mobile app interface, implement screens from designs, integrate with backend APIs, handle state management, and optimize performance.",
-                    "estimated_hours": 48,
-                    "dependencies": [3, 4],
-                    "deadline": (start_date + timedelta(days=max(10, int(total_days*0.7)))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Development"
-                },
-                {
-                    "id": 6,
-                    "title": "Testing & Quality Assurance",
-                    "description": "Execute comprehensive testing including unit tests, integration tests, UI tests, performance testing, and security audits. Fix identified bugs and optimize code.",
-                    "estimated_hours": 24,
-                    "dependencies": [5],
-                    "deadline": (start_date + timedelta(days=max(13, int(total_days*0.85)))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Testing"
-                },
-                {
-                    "id": 7,
-                    "title": "App Store Preparation & Submission",
-                    "description": "Prepare app store listings, create screenshots and promotional materials, write descriptions, configure store settings, and submit for review.",
-                    "estimated_hours": 12,
-                    "dependencies": [6],
-                    "deadline": (start_date + timedelta(days=max(15, int(total_days*0.9)))).strftime("%Y-%m-%d"),
-                    "priority": "Medium",
-                    "category": "Publishing"
-                },
-                {
-                    "id": 8,
-                    "title": "Marketing Campaign & Launch",
-                    "description": "Execute marketing strategy, coordinate social media campaigns, send press releases, engage with early users, and monitor initial user feedback and analytics.",
-                    "estimated_hours": 16,
-                    "dependencies": [7],
-                    "deadline": end_date.strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Marketing"
-                }
-            ]
-
-        # Event Organization Pattern
-        elif any(word in goal_lower for word in ['event', 'meeting', 'conference', 'workshop', 'party', 'gathering']):
-            tasks = [
-                {
-                    "id": 1,
-                    "title": "Event Concept & Planning",
-                    "description": "Define event objectives, determine target audience, establish theme and format, create preliminary budget, and develop overall event strategy.",
-                    "estimated_hours": 8,
-                    "dependencies": [],
-                    "deadline": (start_date + timedelta(days=max(1, total_days//6))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Planning"
-                },
-                {
-                    "id": 2,
-                    "title": "Venue Selection & Booking",
-                    "description": "Research suitable venues, conduct site visits, evaluate capacity and amenities, negotiate contracts, and secure venue booking with required deposits.",
-                    "estimated_hours": 12,
-                    "dependencies": [1],
-                    "deadline": (start_date + timedelta(days=max(2, total_days//4))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Logistics"
-                },
-                {
-                    "id": 3,
-                    "title": "Vendor Coordination & Services",
-                    "description": "Source and book catering services, arrange AV equipment, hire photographers, coordinate with decorators, and confirm all service provider contracts.",
-                    "estimated_hours": 16,
-                    "dependencies": [2],
-                    "deadline": (start_date + timedelta(days=max(4, total_days//2))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Logistics"
-                },
-                {
-                    "id": 4,
-                    "title": "Guest Management & Invitations",
-                    "description": "Compile guest list, design and send invitations (digital/physical), track RSVPs, manage dietary requirements, and arrange seating plan.",
-                    "estimated_hours": 10,
-                    "dependencies": [1],
-                    "deadline": (start_date + timedelta(days=max(3, int(total_days*0.4)))).strftime("%Y-%m-%d"),
-                    "priority": "Medium",
-                    "category": "Communications"
-                },
-                {
-                    "id": 5,
-                    "title": "Event Program & Schedule",
-                    "description": "Create detailed event timeline, coordinate speakers or performers, prepare scripts or run sheets, and conduct final walkthroughs with all stakeholders.",
-                    "estimated_hours": 8,
-                    "dependencies": [2, 3],
-                    "deadline": (start_date + timedelta(days=max(6, int(total_days*0.75)))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Planning"
-                },
-                {
-                    "id": 6,
-                    "title": "Event Execution & Management",
-                    "description": "Oversee event setup, coordinate all vendors and staff, manage timeline execution, handle real-time issues, and ensure smooth event flow from start to finish.",
-                    "estimated_hours": 12,
-                    "dependencies": [3, 4, 5],
-                    "deadline": end_date.strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Execution"
-                }
-            ]
-
-        # Learning/Education Pattern
-        elif any(word in goal_lower for word in ['learn', 'study', 'course', 'training', 'skill', 'master']):
-            subject = "the subject"
-            for word in goal.split():
-                if word.lower() in ['python', 'java', 'javascript', 'programming', 'coding', 'data', 'science', 'machine', 'learning']:
-                    subject = word.capitalize()
-                    break
-
-            tasks = [
-                {
-                    "id": 1,
-                    "title": f"Foundation & Environment Setup for {subject}",
-                    "description": f"Install necessary software and tools, set up development environment, learn basic syntax and core concepts of {subject}, and complete beginner tutorials.",
-                    "estimated_hours": 12,
-                    "dependencies": [],
-                    "deadline": (start_date + timedelta(days=max(2, total_days//5))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Learning"
-                },
-                {
-                    "id": 2,
-                    "title": f"Intermediate Concepts & Hands-on Practice",
-                    "description": f"Study intermediate {subject} concepts through structured courses, complete coding exercises and challenges, build small practice projects, and participate in coding communities.",
-                    "estimated_hours": 24,
-                    "dependencies": [1],
-                    "deadline": (start_date + timedelta(days=max(6, int(total_days*0.6)))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Learning"
-                },
-                {
-                    "id": 3,
-                    "title": f"Advanced Topics & Real-world Applications",
-                    "description": f"Explore advanced {subject} topics including best practices, design patterns, optimization techniques. Work on complex problems and study real-world code examples.",
-                    "estimated_hours": 20,
-                    "dependencies": [2],
-                    "deadline": (start_date + timedelta(days=max(10, int(total_days*0.8)))).strftime("%Y-%m-%d"),
-                    "priority": "Medium",
-                    "category": "Practice"
-                },
-                {
-                    "id": 4,
-                    "title": f"Capstone Project & Portfolio Development",
-                    "description": f"Design and build a comprehensive {subject} project demonstrating learned skills. Document code, create README, deploy project, and add to professional portfolio.",
-                    "estimated_hours": 16,
-                    "dependencies": [3],
-                    "deadline": end_date.strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Portfolio"
-                }
-            ]
-
-        # Research/Academic Pattern
-        elif any(word in goal_lower for word in ['research', 'paper', 'thesis', 'study', 'analysis', 'report']):
-            tasks = [
-                {
-                    "id": 1,
-                    "title": "Topic Selection & Literature Review",
-                    "description": "Define research question, conduct comprehensive literature review, identify gaps in existing research, and develop theoretical framework. Compile annotated bibliography.",
-                    "estimated_hours": 20,
-                    "dependencies": [],
-                    "deadline": (start_date + timedelta(days=max(2, total_days//4))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Research"
-                },
-                {
-                    "id": 2,
-                    "title": "Research Methodology Design",
-                    "description": "Develop research methodology, design data collection instruments, establish sampling strategy, and prepare ethics approval documentation if required.",
-                    "estimated_hours": 12,
-                    "dependencies": [1],
-                    "deadline": (start_date + timedelta(days=max(4, total_days//3))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Planning"
-                },
-                {
-                    "id": 3,
-                    "title": "Data Collection & Analysis",
-                    "description": "Execute data collection according to methodology, organize and clean data, perform statistical analysis, generate visualizations, and interpret results.",
-                    "estimated_hours": 24,
-                    "dependencies": [2],
-                    "deadline": (start_date + timedelta(days=max(8, int(total_days*0.65)))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Research"
-                },
-                {
-                    "id": 4,
-                    "title": "Writing & Documentation",
-                    "description": "Write research paper sections (introduction, methodology, results, discussion, conclusion), create tables and figures, ensure proper citations, and format according to requirements.",
-                    "estimated_hours": 20,
-                    "dependencies": [3],
-                    "deadline": (start_date + timedelta(days=max(11, int(total_days*0.85)))).strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Writing"
-                },
-                {
-                    "id": 5,
-                    "title": "Review, Revision & Submission",
-                    "description": "Proofread paper, incorporate peer feedback, verify citations and references, check formatting compliance, and submit final version before deadline.",
-                    "estimated_hours": 12,
-                    "dependencies": [4],
-                    "deadline": end_date.strftime("%Y-%m-%d"),
-                    "priority": "High",
-                    "category": "Finalization"
-                }
-            ]
-
-        # Generic Pattern for other goals
-        else:
-            num_tasks = max(4, min(7, total_days // 3))
-            task_duration = total_days / num_tasks
-
-            phase_templates = [
-                {
-                    "name": "Planning & Requirements",
-                    "description": "Define objectives, gather requirements, identify stakeholders, create project plan, and establish success criteria for: {goal}",
-                    "category": "Planning"
-                },
-                {
-                    "name": "Research & Preparation",
-                    "description": "Conduct necessary research, gather resources, identify potential challenges, and prepare detailed approach for executing: {goal}",
-                    "category": "Research"
-                },
-                {
-                    "name": "Implementation Phase 1",
-                    "description": "Begin core execution activities, establish foundations, implement initial components, and validate approach for: {goal}",
-                    "category": "Development"
-                },
-                {
-                    "name": "Implementation Phase 2",
-                    "description": "Continue development work, integrate components, address identified issues, and complete majority of work for: {goal}",
-                    "category": "Development"
-                },
-                {
-                    "name": "Testing & Quality Assurance",
-                    "description": "Conduct thorough testing, verify all requirements are met, identify and fix issues, and ensure quality standards for: {goal}",
-                    "category": "Testing"
-                },
-                {
-                    "name": "Finalization & Documentation",
-                    "description": "Complete remaining tasks, create necessary documentation, prepare deliverables, and finalize all aspects of: {goal}",
-                    "category": "Finalization"
-                },
-                {
-                    "name": "Delivery & Completion",
-                    "description": "Deliver final output, gather feedback, ensure stakeholder satisfaction, and officially close project for: {goal}",
-                    "category": "Completion"
-                }
-            ]
-
-            for i in range(num_tasks):
-                template = phase_templates[min(i, len(phase_templates)-1)]
-                task_date = start_date + timedelta(days=int(i * task_duration))
-
-                tasks.append({
-                    "id": i + 1,
-                    "title": template["name"],
-                    "description": template["description"].format(goal=goal),
-                    "estimated_hours": 10 + (i % 3) * 6,
-                    "dependencies": [i] if i > 0 else [],
-                    "deadline": task_date.strftime("%Y-%m-%d"),
-                    "priority": ["High", "High", "Medium", "High", "High", "Medium", "High"][min(i, 6)],
-                    "category": template["category"]
-                })
-
-        # Create meaningful milestones
-        milestones = [
-            {
-                "name": "Project Kickoff & Planning Complete",
-                "date": start_date.strftime("%Y-%m-%d"),
-                "tasks_completed": []
-            }
-        ]
+        # Long goals are not cached: the generic plan repeats the goal in
+        # every task description, so each entry would cost several times its size
+        if len(goal) > MAX_CACHED_GOAL_LENGTH:
+            return _rule_based_plan(goal, now)
 
-        if len(tasks) > 3:
-            third_point = len(tasks) // 3
-            two_third_point = (len(tasks) * 2) // 3
-
-            milestones.append({
-                "name": "Initial Phase Complete",
-                "date": (start_date + timedelta(days=total_days//3)).strftime("%Y-%m-%d"),
-                "tasks_completed": [task["id"] for task in tasks[:third_point]]
-            })
-
-            milestones.append({
-                "name": "Development Phase Complete",
-                "date": (start_date + timedelta(days=(total_days*2)//3)).strftime("%Y-%m-%d"),
-                "tasks_completed": [task["id"] for task in tasks[:two_third_point]]
-            })
-
-        milestones.append({
-            "name": "Project Completion & Delivery",
-            "date": end_date.strftime("%Y-%m-%d"),
-            "tasks_completed": [task["id"] for task in tasks]
-        })
+        key = (goal, now.strftime("%Y-%m-%d"))
+
+        with self._fallback_cache_lock:
+            cached = self._fallback_cache.get(key)
+
+        if cached is None:
+            # Stored as orjson bytes: loading them is a cheap deep copy, so
+            # callers can mutate the plan (e.g. set plan['id']) safely
+            cached = orjson.dumps(_rule_based_plan(goal, now))
+            with self._fallback_cache_lock:
+                self._fallback_cache[key] = cached
+                if len(self._fallback_cache) > FALLBACK_CACHE_SIZE:
+                    self._fallback_cache.popitem(last=False)
+
+        return orjson.loads(cached)
 
-        return {
-            "goal": goal,
-            "estimated_duration": f"{total_days} days",
-            "tasks": tasks,
-            "timeline": {
-                "start_date": start_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d"),
-                "milestones": milestones
-            }
-        }
 
 # Initialize the LLM task planner
 planner = LLMTaskPlanner()
@@ -596,34 +627,67 @@ def home():
     return render_template('index.html')
 
 @app.route('/api/plan', methods=['POST'])
-def create_plan():
+async def create_plan():
     '''API endpoint to create a task plan using LLM'''
     try:
         data = request.get_json()
         goal = data.get('goal', '').strip()
 
         if not goal:
-            return jsonify({'error': 'Goal is required'}), 400
+            return _json({'error': 'Goal is required'}, 400)
 
         # Generate the task plan using LLM
-        plan = planner.generate_task_plan(goal)
+        plan = await planner.generate_task_plan_async(goal)
 
         # Save to database
         plan_id = planner.save_plan(goal, plan)
         plan['id'] = plan_id
         plan['llm_method'] = planner.llm_method
 
-        return jsonify({
+        return _json({
             'success': True,
             'plan': plan,
             'llm_method': planner.llm_method
         })
 
     except Exception as e:
-        return jsonify({
+        return _json({
+            'success': False,
+            'error': str(e)
+        }, 500)
+
+@app.route('/api/plan/batch', methods=['POST'])
+async def create_plans():
+    '''API endpoint to create task plans for several goals concurrently'''
+    try:
+        data = request.get_json()
+        goals = data.get('goals') if isinstance(data, dict) else None
+
+        if (not isinstance(goals, list) or not goals
+                or not all(isinstance(goal, str) and goal.strip() for goal in goals)):
+            return _json({'error': 'goals must be a non-empty list of non-empty strings'}, 400)
+
+        goals = [goal.strip() for goal in goals]
+
+        plans = await planner.generate_task_plans_async(goals)
+
+        # Save to database in a single transaction
+        plan_ids = planner.save_plans(list(zip(goals, plans)))
+        for plan, plan_id in zip(plans, plan_ids):
+            plan['id'] = plan_id
+            plan['llm_method'] = planner.llm_method
+
+        return _json({
+            'success': True,
+            'plans': plans,
+            'llm_method': planner.llm_method
+        })
+
+    except Exception as e:
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/plan/<int:plan_id>', methods=['GET'])
 def get_plan(plan_id):
@@ -632,23 +696,23 @@ def get_plan(plan_id):
         plan = planner.get_plan(plan_id)
 
         if not plan:
-            return jsonify({'error': 'Plan not found'}), 404
+            return _json({'error': 'Plan not found'}, 404)
 
-        return jsonify({
+        return _json({
             'success': True,
             'plan': plan
         })
 
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     '''Health check endpoint with LLM status'''
-    return jsonify({
+    return _json({
         'status': 'healthy',
         'llm_method': planner.llm_method,
         'timestamp': datetime.now().isoformat()
@@ -657,7 +721,7 @@ def health_check():
 @app.route('/api/llm-status', methods=['GET'])
 def llm_status():
     '''Get current LLM configuration and status'''
-    return jsonify({
+    return _json({
         'current_method': planner.llm_method,
         'available_methods': {
             'ollama': planner.check_ollama_server(),
@@ -670,6 +734,16 @@ def llm_status():
         }
     })
 
+def serve_production(host='0.0.0.0', port=5000):
+    '''Serve the app with waitress instead of the Flask development server'''
+    try:
+        from waitress import serve
+    except ImportError:
+        print("[ERROR] waitress is not installed. Run: pip install waitress")
+        return
+
+    serve(app, host=host, port=port, threads=WAITRESS_THREADS)
+
 if __name__ == '__main__':
     print("Smart Task Planner with LLM Integration")
     print(f"Using method: {planner.llm_method}")
@@ -681,5 +755,18 @@ if __name__ == '__main__':
         print("   - Download from: https://ollama.ai")
         print("   - Run: ollama pull llama2")
 
+    # --prod serves with waitress, without the reloader and debugger; use it
+    # when benchmarking (e.g. with test_api.py)
+    prod = '--prod' in sys.argv[1:]
+    if not prod:
+        print("\n[INFO] Debug mode: the reloader and debugger slow down every request")
+        print("For benchmarks, run: python app.py --prod")
+        print("For production, run: gunicorn app:app  (settings in gunicorn.conf.py)")
+
+    planner.warmup()
+
     print(f"\nStarting server on http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if prod:
+        serve_production()
+    else:
+        app.run(debug=True, host='0.0.0.0', port=5000)
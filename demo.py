@@ -4,18 +4,37 @@ Smart Task Planner Demo Script
 Demonstrates LLM integration and AI-powered task generation capabilities
 """
 
-from app import LLMTaskPlanner
+import argparse
 import json
 from datetime import datetime
 import time
 import sys
 
+BANNER = """\
+============================================================
+     SMART TASK PLANNER - LLM DEMO
+    AI-Powered Task Generation Demo
+============================================================
+"""
+
+TAKEAWAYS = """
+Key Takeaways:
+   - AI adapts task generation based on goal context
+   - Different LLM methods provide varying quality levels
+   - Dependencies and timelines are intelligently calculated
+   - Task descriptions are contextually relevant
+   - Milestones help track project progress
+
+Ready to use the Smart Task Planner:
+   1. Run: python run.py
+   2. Select option 1 (Start Web Application)
+   3. Open: http://localhost:5000
+   4. Enter your own goals and start planning!
+
+Thank you for trying the Smart Task Planner AI Demo!"""
+
 def print_banner():
-    print("="*60)
-    print("     SMART TASK PLANNER - LLM DEMO")
-    print("    AI-Powered Task Generation Demo")
-    print("="*60)
-    print()
+    print(BANNER)
 
 def print_llm_status(planner):
     """Display current LLM configuration"""
@@ -41,52 +60,59 @@ def print_llm_status(planner):
 
     print()
 
+_PRIORITY_MARKERS = {"High": "[HIGH]", "Medium": "[MED]", "Low": "[LOW]"}
+_priority_marker = _PRIORITY_MARKERS.get
+
 def print_plan_detailed(plan, plan_num, total_plans):
     """Print a comprehensive plan breakdown"""
-    print(f"\n{'='*80}")
-    print(f"DEMO {plan_num}/{total_plans}: AI TASK BREAKDOWN")
-    print(f"{'='*80}")
-
-    print(f"\nGOAL: {plan['goal']}")
-    print(f"DURATION: {plan['estimated_duration']}")
-    print(f"TIMELINE: {plan['timeline']['start_date']} to {plan['timeline']['end_date']}")
-    print(f"TASKS: {len(plan['tasks'])} total")
-
-    print("\n" + "-"*80)
-    print("AI-GENERATED TASK BREAKDOWN:")
-    print("-"*80)
+    # Collected and written once; a print() per field is slow for long plans
+    lines = [
+        f"\n{'='*80}",
+        f"DEMO {plan_num}/{total_plans}: AI TASK BREAKDOWN",
+        f"{'='*80}",
+        f"\nGOAL: {plan['goal']}",
+        f"DURATION: {plan['estimated_duration']}",
+        f"TIMELINE: {plan['timeline']['start_date']} to {plan['timeline']['end_date']}",
+        f"TASKS: {len(plan['tasks'])} total",
+        "\n" + "-"*80,
+        "AI-GENERATED TASK BREAKDOWN:",
+        "-"*80,
+    ]
 
     for task in plan['tasks']:
-        priority_marker = {"High": "[HIGH]", "Medium": "[MED]", "Low": "[LOW]"}
-        priority = priority_marker.get(task['priority'], "[NORMAL]")
+        priority = _priority_marker(task['priority'], "[NORMAL]")
 
-        print(f"\n{priority} TASK {task['id']}: {task['title']}")
-        print(f"   Description: {task['description']}")
-        print(f"   Deadline: {task['deadline']} | Hours: {task['estimated_hours']}h")
-        print(f"   Category: {task['category']} | Priority: {task['priority']}")
+        lines.append(f"\n{priority} TASK {task['id']}: {task['title']}")
+        lines.append(f"   Description: {task['description']}")
+        lines.append(f"   Deadline: {task['deadline']} | Hours: {task['estimated_hours']}h")
+        lines.append(f"   Category: {task['category']} | Priority: {task['priority']}")
 
         if task['dependencies']:
-            deps = ', '.join([f"Task {dep}" for dep in task['dependencies']])
-            print(f"   Dependencies: {deps}")
+            deps = "Task " + ", Task ".join(map(str, task['dependencies']))
+            lines.append(f"   Dependencies: {deps}")
         else:
-            print(f"   Dependencies: None (can start immediately)")
+            lines.append(f"   Dependencies: None (can start immediately)")
 
-    print("\n" + "-"*80)
-    print("PROJECT MILESTONES:")
-    print("-"*80)
+    lines.append("\n" + "-"*80)
+    lines.append("PROJECT MILESTONES:")
+    lines.append("-"*80)
 
     for milestone in plan['timeline']['milestones']:
-        print(f"\n[MILESTONE] {milestone['name']}")
-        print(f"   Target Date: {milestone['date']}")
+        lines.append(f"\n[MILESTONE] {milestone['name']}")
+        lines.append(f"   Target Date: {milestone['date']}")
         if milestone['tasks_completed']:
-            completed = ', '.join([f"Task {task_id}" for task_id in milestone['tasks_completed']])
-            print(f"   Tasks to Complete: {completed}")
+            completed = "Task " + ", Task ".join(map(str, milestone['tasks_completed']))
+            lines.append(f"   Tasks to Complete: {completed}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def main():
-    """Main demo orchestration"""
+def main(batch=False):
+    """Main demo orchestration; batch generates every plan at once without pausing"""
     print_banner()
 
     try:
+        # Imported here so the banner shows before Flask and the LLM clients load
+        from app import LLMTaskPlanner
         planner = LLMTaskPlanner()
     except Exception as e:
         print(f"[ERROR] Failed to initialize planner: {e}")
@@ -109,18 +135,29 @@ def main():
     print("="*80)
     print("Watch the AI generate detailed task breakdowns for different goal types\n")
 
-    for i, goal in enumerate(demo_goals, 1):
-        print(f"\nDemo {i}/{len(demo_goals)}: Processing '{goal}'")
-        print("AI analyzing goal context and requirements...")
+    if batch:
+        print(f"Generating {len(demo_goals)} plans in one batch...")
 
-        plan = planner.generate_task_plan(goal)
-        plan_id = planner.save_plan(goal, plan)
-        print(f"[INFO] Saved as Plan ID: {plan_id}")
+        # Ollama requests run concurrently on the planner's worker pool
+        plans = planner.generate_task_plans(demo_goals)
+        plan_ids = planner.save_plans(list(zip(demo_goals, plans)))
+
+        for i, (plan, plan_id) in enumerate(zip(plans, plan_ids), 1):
+            print(f"\n[INFO] Demo {i}/{len(demo_goals)} saved as Plan ID: {plan_id}")
+            print_plan_detailed(plan, i, len(demo_goals))
+    else:
+        for i, goal in enumerate(demo_goals, 1):
+            print(f"\nDemo {i}/{len(demo_goals)}: Processing '{goal}'")
+            print("AI analyzing goal context and requirements...")
 
-        print_plan_detailed(plan, i, len(demo_goals))
+            plan = planner.generate_task_plan(goal)
+            plan_id = planner.save_plan(goal, plan)
+            print(f"[INFO] Saved as Plan ID: {plan_id}")
 
-        if i < len(demo_goals):
-            input("\nPress Enter to continue to next demo...")
+            print_plan_detailed(plan, i, len(demo_goals))
+
+            if i < len(demo_goals):
+                input("\nPress Enter to continue to next demo...")
 
     print(f"\n{'='*80}")
     print("DEMO COMPLETED SUCCESSFULLY!")
@@ -128,24 +165,16 @@ def main():
 
     print(f"\n[INFO] All demonstrations finished!")
     print(f"\n[INFO] AI Method Used: {planner.llm_method.upper()}")
-    print(f"\nKey Takeaways:")
-    print("   - AI adapts task generation based on goal context")
-    print("   - Different LLM methods provide varying quality levels")
-    print("   - Dependencies and timelines are intelligently calculated")
-    print("   - Task descriptions are contextually relevant")
-    print("   - Milestones help track project progress")
-
-    print(f"\nReady to use the Smart Task Planner:")
-    print("   1. Run: python run.py")
-    print("   2. Select option 1 (Start Web Application)")
-    print("   3. Open: http://localhost:5000")
-    print("   4. Enter your own goals and start planning!")
-
-    print(f"\nThank you for trying the Smart Task Planner AI Demo!")
+    print(TAKEAWAYS)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Smart Task Planner LLM demo")
+    parser.add_argument("--batch", action="store_true",
+                        help="generate all demo plans at once and skip the pauses between them")
+    args = parser.parse_args()
+
     try:
-        main()
+        main(batch=args.batch)
     except KeyboardInterrupt:
         print("\n\nDemo interrupted by user. Goodbye!")
     except Exception as e:
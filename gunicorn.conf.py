@@ -0,0 +1,31 @@
+"""
+Smart Task Planner - Gunicorn Configuration
+Production server settings, picked up automatically by:
+
+    gunicorn app:app
+"""
+
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# Each worker is its own process with its own planner and SQLite pool; the
+# threads inside a worker serve concurrent requests while others wait on Ollama
+workers = int(os.getenv('WEB_CONCURRENCY', max(2, (os.cpu_count() or 1) // 2)))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+keepalive = 30
+
+# Ollama plans can take well over Gunicorn's default 30 seconds
+timeout = 120
+
+# Import the app in every worker rather than once in the master, so no
+# SQLite connection or thread pool is shared across a fork
+preload_app = False
+
+def post_worker_init(worker):
+    '''Give each worker its own connection pool when the app was preloaded'''
+    if worker.cfg.preload_app:
+        from app import planner
+        planner.open_pool()
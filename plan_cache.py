@@ -0,0 +1,313 @@
+"""
+Smart Task Planner - Plan Caches
+Reuses stored LLM plans for goals that are worded differently but mean the same thing
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Optional
+import atexit
+import copy
+import importlib.util
+import os
+import re
+import tempfile
+import threading
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are not locked across processes
+    fcntl = None
+
+# numpy and sentence-transformers (which pulls in torch) are imported by
+# PlanCache only, so importing the app does not pay for them
+np = None
+EMBEDDINGS_AVAILABLE = (importlib.util.find_spec("numpy") is not None
+                        and importlib.util.find_spec("sentence_transformers") is not None)
+
+PLAN_CACHE_ENABLED = os.getenv('PLAN_CACHE_ENABLED') == '1'
+
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+SIMILARITY_THRESHOLD = 0.90
+MAX_ENTRIES = 1000
+
+DATE_FORMAT = "%Y-%m-%d"
+
+GOAL_CACHE_FILE = 'plan_cache.json'
+GOAL_CACHE_SIZE = 256
+
+# Filler words dropped from goal fingerprints
+_STOPWORDS = frozenset(('a', 'an', 'the', 'in', 'on', 'for', 'to', 'of', 'and',
+                        'my', 'our', 'new', 'within', 'over', 'next'))
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+def shift_plan_dates(plan: Dict[str, Any], start_date: datetime) -> Dict[str, Any]:
+    '''Return a copy of the plan with every date moved so it starts on start_date'''
+    plan = copy.deepcopy(plan)
+    timeline = plan.get('timeline') or {}
+
+    try:
+        delta = start_date.date() - datetime.strptime(timeline['start_date'], DATE_FORMAT).date()
+    except (KeyError, TypeError, ValueError):
+        return plan
+
+    def shift(value):
+        try:
+            return (datetime.strptime(value, DATE_FORMAT) + delta).strftime(DATE_FORMAT)
+        except (TypeError, ValueError):
+            return value
+
+    if delta:
+        for key in ('start_date', 'end_date'):
+            if key in timeline:
+                timeline[key] = shift(timeline[key])
+        for milestone in timeline.get('milestones') or []:
+            if 'date' in milestone:
+                milestone['date'] = shift(milestone['date'])
+        for task in plan.get('tasks') or []:
+            if 'deadline' in task:
+                task['deadline'] = shift(task['deadline'])
+
+    return plan
+
+class PlanCache:
+    '''Embedding-keyed plan store backed by the plan_cache SQLite table
+
+    A new goal reuses a cached plan when its cosine similarity to a stored
+    goal is at least SIMILARITY_THRESHOLD and both goals ask for the same
+    number of days. The least frequently used entry is evicted once the
+    cache holds MAX_ENTRIES plans.
+    '''
+
+    def __init__(self, conn, writer):
+        global np
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+
+        # conn / writer are the planner's pooled connection context managers
+        self._conn = conn
+        self._writer = writer
+        self._lock = threading.Lock()
+        self._model = SentenceTransformer(EMBEDDING_MODEL)
+        self._embed = lru_cache(maxsize=256)(self._encode)
+
+        with self._writer() as c:
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS plan_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    goal TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    plan TEXT NOT NULL,
+                    total_days INTEGER NOT NULL,
+                    freq INTEGER DEFAULT 1
+                )
+            ''')
+
+        with self._conn() as c:
+            rows = c.execute('SELECT id, embedding, total_days, freq FROM plan_cache').fetchall()
+
+        # In-memory mirror of the table used for the vectorized similarity search
+        self._ids = [row[0] for row in rows]
+        self._days = np.array([row[2] for row in rows], dtype=np.int64)
+        self._freq = np.array([row[3] for row in rows], dtype=np.int64)
+        dim = self._model.get_sentence_embedding_dimension()
+        self._matrix = (np.stack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+                        if rows else np.empty((0, dim), dtype=np.float32))
+
+    def _encode(self, goal: str):
+        '''Embed a goal as a unit-length float32 vector'''
+        return self._model.encode(goal, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, goal: str, total_days: int) -> Optional[Dict[str, Any]]:
+        '''Return the cached plan for the most similar goal, re-dated to today'''
+        embedding = self._embed(goal)
+
+        with self._lock:
+            if not self._ids:
+                return None
+
+            scores = self._matrix @ embedding
+            scores[self._days != total_days] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] < SIMILARITY_THRESHOLD:
+                return None
+
+            entry_id = self._ids[best]
+            self._freq[best] += 1
+
+        with self._writer() as c:
+            c.execute('UPDATE plan_cache SET freq = freq + 1 WHERE id = ?', (entry_id,))
+
+        with self._conn() as c:
+            result = c.execute('SELECT plan FROM plan_cache WHERE id = ?', (entry_id,)).fetchone()
+
+        if not result:
+            return None
+
+        plan = shift_plan_dates(orjson.loads(result[0]), datetime.now())
+        plan['goal'] = goal
+        return plan
+
+    def store(self, goal: str, total_days: int, plan: Dict[str, Any]):
+        '''Add a freshly generated plan, evicting the least used entry when full'''
+        embedding = self._embed(goal)
+
+        with self._lock:
+            with self._writer() as c:
+                if len(self._ids) >= MAX_ENTRIES:
+                    victim = int(np.argmin(self._freq))
+                    c.execute('DELETE FROM plan_cache WHERE id = ?', (self._ids[victim],))
+                    del self._ids[victim]
+                    self._days = np.delete(self._days, victim)
+                    self._freq = np.delete(self._freq, victim)
+                    self._matrix = np.delete(self._matrix, victim, axis=0)
+
+                cursor = c.execute(
+                    'INSERT INTO plan_cache (goal, embedding, plan, total_days) VALUES (?, ?, ?, ?)',
+                    (goal, embedding.tobytes(), orjson.dumps(plan).decode(), total_days)
+                )
+
+            self._ids.append(cursor.lastrowid)
+            self._days = np.append(self._days, total_days)
+            self._freq = np.append(self._freq, 1)
+            self._matrix = np.vstack([self._matrix, embedding])
+
+def goal_fingerprint(goal: str, total_days: int) -> str:
+    '''Order- and filler-insensitive key for a goal and its timeframe
+
+    "Launch a mobile app in 3 weeks" and "launch mobile app in 3 weeks" share
+    a fingerprint. The timeframe is part of the key because reordering the
+    tokens can change which duration the goal asks for.
+    '''
+    tokens = sorted(set(_TOKEN_RE.findall(goal.lower())) - _STOPWORDS)
+    return f"{total_days}:{' '.join(tokens)}"
+
+class GoalPlanCache:
+    '''LRU map of goal fingerprints to LLM plans, saved to disk on exit
+
+    Unlike PlanCache this needs no embedding model, so it is always on when
+    plans come from Ollama. The file is shared by every process started from
+    the same directory, so repeated demo and test runs skip the LLM. Use
+    goal_plan_cache() rather than the constructor so every planner in a
+    process shares one instance per file.
+    '''
+
+    def __init__(self, path: str = GOAL_CACHE_FILE, maxsize: int = GOAL_CACHE_SIZE):
+        self._path = path
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._plans = self._read()
+        # Keys stored by this process; only these override the file on save
+        self._dirty = set()
+
+        atexit.register(self.save)
+
+    def _read(self) -> "OrderedDict[str, Dict[str, Any]]":
+        '''Load the plans currently saved on disk, oldest first'''
+        try:
+            with open(self._path, 'rb') as f:
+                return OrderedDict(orjson.loads(f.read()))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[WARNING] Ignoring unreadable {self._path}: {e}")
+        return OrderedDict()
+
+    def lookup(self, goal: str, total_days: int) -> Optional[Dict[str, Any]]:
+        '''Return a copy of the plan stored for this goal, re-dated to today'''
+        key = goal_fingerprint(goal, total_days)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                return None
+            self._plans.move_to_end(key)
+
+        # shift_plan_dates copies, so callers never mutate the cached plan
+        plan = shift_plan_dates(plan, datetime.now())
+        plan['goal'] = goal
+        return plan
+
+    def store(self, goal: str, total_days: int, plan: Dict[str, Any]):
+        '''Remember a freshly generated plan, dropping the least recently used when full'''
+        key = goal_fingerprint(goal, total_days)
+        plan = copy.deepcopy(plan)
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            self._dirty.add(key)
+            if len(self._plans) > self._maxsize:
+                self._plans.popitem(last=False)
+
+    def save(self):
+        '''Merge this process's plans into the file; called automatically at exit
+
+        Other processes (demo runs, Gunicorn workers) may save the same file,
+        so the re-read, merge and replace run under an advisory lock on a
+        sidecar .lock file, and only keys stored here replace what is on disk.
+        The file is replaced atomically, so a reader never sees it half written.
+        '''
+        with self._lock:
+            if not self._dirty:
+                return
+
+            try:
+                with _file_lock(self._path + '.lock'):
+                    merged = self._read()
+                    for key, plan in self._plans.items():
+                        if key in self._dirty or key not in merged:
+                            merged[key] = plan
+                        merged.move_to_end(key)
+                    while len(merged) > self._maxsize:
+                        merged.popitem(last=False)
+
+                    _write_atomic(self._path, orjson.dumps(merged))
+            except OSError as e:
+                print(f"[WARNING] Could not save {self._path}: {e}")
+                return
+
+            self._plans = merged
+            self._dirty.clear()
+
+@contextmanager
+def _file_lock(path: str):
+    '''Hold an exclusive advisory lock on path (a no-op without fcntl)'''
+    if fcntl is None:
+        yield
+        return
+
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def _write_atomic(path: str, data: bytes):
+    '''Write data to a temporary file next to path, then rename it over path'''
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.plan_cache.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates the file readable by the owner only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+_GOAL_CACHES: Dict[str, GoalPlanCache] = {}
+_GOAL_CACHES_LOCK = threading.Lock()
+
+def goal_plan_cache(path: str = GOAL_CACHE_FILE) -> GoalPlanCache:
+    '''Return the process-wide GoalPlanCache for a file, creating it on first use'''
+    key = os.path.abspath(path)
+    with _GOAL_CACHES_LOCK:
+        cache = _GOAL_CACHES.get(key)
+        if cache is None:
+            cache = _GOAL_CACHES[key] = GoalPlanCache(path)
+        return cache
@@ -0,0 +1,519 @@
+"""
+Smart Task Planner - Rule-Based Planner Core
+Keyword classification and template-driven plan generation used when no LLM is available.
+Plain, fully annotated Python so it can be compiled with mypyc (see setup.py).
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator
+import re
+
+try:
+    import ahocorasick  # type: ignore
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Earlier units win when a goal mentions several ("2 days ... 3 weeks" -> weeks)
+_TIME_RE = re.compile(r'(\d+)\s*(week|day|month)s?', re.I)
+_DAYS_PER_UNIT = (('week', 7), ('day', 1), ('month', 30))
+
+# Caches keyed on goal text skip longer goals, so a client sending huge
+# goals cannot pin (entries x goal size) bytes of memory
+MAX_CACHED_GOAL_LENGTH = 500
+
+def extract_timeframe(goal: str) -> int:
+    '''Extract time frame (in days) from goal text'''
+    if len(goal) > MAX_CACHED_GOAL_LENGTH:
+        return _parse_timeframe(goal)
+    return _cached_timeframe(goal)
+
+def _parse_timeframe(goal: str) -> int:
+    '''Uncached body of extract_timeframe'''
+    found: Dict[str, int] = {}
+    for match in _TIME_RE.finditer(goal):
+        found.setdefault(match.group(2).lower(), int(match.group(1)))
+
+    for unit, days in _DAYS_PER_UNIT:
+        if unit in found:
+            return found[unit] * days
+
+    return 14  # default 2 weeks
+
+_cached_timeframe = lru_cache(maxsize=4096)(_parse_timeframe)
+
+# Goal categories in dispatch order; a goal matching several uses the first
+_CATEGORY_KEYWORDS = (
+    ('product_app', ('product', 'launch', 'app', 'software', 'platform', 'mobile')),
+    ('event', ('event', 'meeting', 'conference', 'workshop', 'party', 'gathering')),
+    ('learning', ('learn', 'study', 'course', 'training', 'skill', 'master')),
+    ('research', ('research', 'paper', 'thesis', 'study', 'analysis', 'report')),
+)
+_SUBJECT_KEYWORDS = ('python', 'java', 'javascript', 'programming', 'coding',
+                     'data', 'science', 'machine', 'learning')
+
+def _keyword_labels() -> Dict[str, Tuple[str, ...]]:
+    '''Map every category and subject keyword to the labels it signals'''
+    labels: Dict[str, List[str]] = {}
+    for category, words in _CATEGORY_KEYWORDS:
+        for word in words:
+            labels.setdefault(word, []).append(category)
+    for word in _SUBJECT_KEYWORDS:
+        labels.setdefault(word, []).append('subject')
+    return {word: tuple(word_labels) for word, word_labels in labels.items()}
+
+_KEYWORD_LABELS = _keyword_labels()
+
+def _build_keyword_automaton() -> Any:
+    '''Build one automaton matching every category and subject keyword'''
+    automaton = ahocorasick.Automaton()
+    for word, labels in _KEYWORD_LABELS.items():
+        automaton.add_word(word, (word, labels))
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Without pyahocorasick, one lookahead alternation finds a keyword at every
+# position. Longer keywords are tried first, so a keyword starting with a
+# shorter one ("learning" / "learn") also carries the shorter one's categories.
+_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_KEYWORD_LABELS, key=len, reverse=True))) + '))'
+)
+_KEYWORD_RE_LABELS = {
+    word: labels + tuple(label for prefix, prefix_labels in _KEYWORD_LABELS.items()
+                         if prefix != word and word.startswith(prefix)
+                         for label in prefix_labels if label != 'subject')
+    for word, labels in _KEYWORD_LABELS.items()
+}
+
+def _keyword_hits(goal_lower: str) -> Iterator[Tuple[int, str, Tuple[str, ...]]]:
+    '''Yield (start, keyword, labels) for every keyword occurrence in the goal'''
+    if _KEYWORD_AUTOMATON is not None:
+        for end, (word, labels) in _KEYWORD_AUTOMATON.iter(goal_lower):
+            yield end - len(word) + 1, word, labels
+    else:
+        for match in _KEYWORD_RE.finditer(goal_lower):
+            word = match.group(1)
+            yield match.start(), word, _KEYWORD_RE_LABELS[word]
+
+def _classify_goal(goal_lower: str) -> Tuple[str, Optional[str]]:
+    '''Return (goal category or "generic", first whole-word subject keyword or None)'''
+    categories: Set[str] = set()
+    subject: Optional[str] = None
+    subject_start = len(goal_lower)
+    for start, word, labels in _keyword_hits(goal_lower):
+        end = start + len(word)
+        for label in labels:
+            if label != 'subject':
+                categories.add(label)
+            elif (start < subject_start
+                  and (start == 0 or goal_lower[start - 1].isspace())
+                  and (end == len(goal_lower) or goal_lower[end].isspace())):
+                subject, subject_start = word, start
+
+    category = next((name for name, _ in _CATEGORY_KEYWORDS if name in categories), 'generic')
+    return category, subject
+
+# Rule-based task templates, shared by every request. "id" and "deadline" are
+# placeholders filled in per plan; they are listed so the key order matches
+# the generated tasks. Each *_OFFSETS entry is the (minimum days, fraction of
+# the timeline) used for the deadline of the matching task.
+_PRODUCT_OFFSETS = ((1, 1/7), (2, 1/5), (4, 1/3), (7, 0.6), (10, 0.7), (13, 0.85), (15, 0.9), (0, 1.0))
+_PRODUCT_TASKS = (
+    {
+        "id": None,
+        "title": "Market Research & User Analysis",
+        "description": "Conduct comprehensive market research to identify target audience, analyze competitors, and validate product-market fit. Gather user requirements and pain points.",
+        "estimated_hours": 16,
+        "dependencies": (),
+        "deadline": None,
+        "priority": "High",
+        "category": "Research"
+    },
+    {
+        "id": None,
+        "title": "Product Requirements Documentation",
+        "description": "Create detailed product requirements document (PRD) including features, user stories, acceptance criteria, and technical specifications. Define MVP scope.",
+        "estimated_hours": 20,
+        "dependencies": (1,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Planning"
+    },
+    {
+        "id": None,
+        "title": "UI/UX Design & Prototyping",
+        "description": "Design user interface mockups, create wireframes, develop interactive prototypes, and establish design system. Include user flow diagrams and navigation structure.",
+        "estimated_hours": 32,
+        "dependencies": (2,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Design"
+    },
+    {
+        "id": None,
+        "title": "Backend Development & API Implementation",
+        "description": "Develop server-side logic, create RESTful APIs, implement database schema, set up authentication, and configure cloud infrastructure. Include error handling and logging.",
+        "estimated_hours": 40,
+        "dependencies": (2,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Development"
+    },
+    {
+        "id": None,
+        "title": "Frontend Development & Integration",
+        "description": "Build mobile app interface, implement screens from designs, integrate with backend APIs, handle state management, and optimize performance.",
+        "estimated_hours": 48,
+        "dependencies": (3, 4),
+        "deadline": None,
+        "priority": "High",
+        "category": "Development"
+    },
+    {
+        "id": None,
+        "title": "Testing & Quality Assurance",
+        "description": "Execute comprehensive testing including unit tests, integration tests, UI tests, performance testing, and security audits. Fix identified bugs and optimize code.",
+        "estimated_hours": 24,
+        "dependencies": (5,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Testing"
+    },
+    {
+        "id": None,
+        "title": "App Store Preparation & Submission",
+        "description": "Prepare app store listings, create screenshots and promotional materials, write descriptions, configure store settings, and submit for review.",
+        "estimated_hours": 12,
+        "dependencies": (6,),
+        "deadline": None,
+        "priority": "Medium",
+        "category": "Publishing"
+    },
+    {
+        "id": None,
+        "title": "Marketing Campaign & Launch",
+        "description": "Execute marketing strategy, coordinate social media campaigns, send press releases, engage with early users, and monitor initial user feedback and analytics.",
+        "estimated_hours": 16,
+        "dependencies": (7,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Marketing"
+    },
+)
+
+_EVENT_OFFSETS = ((1, 1/6), (2, 1/4), (4, 1/2), (3, 0.4), (6, 0.75), (0, 1.0))
+_EVENT_TASKS = (
+    {
+        "id": None,
+        "title": "Event Concept & Planning",
+        "description": "Define event objectives, determine target audience, establish theme and format, create preliminary budget, and develop overall event strategy.",
+        "estimated_hours": 8,
+        "dependencies": (),
+        "deadline": None,
+        "priority": "High",
+        "category": "Planning"
+    },
+    {
+        "id": None,
+        "title": "Venue Selection & Booking",
+        "description": "Research suitable venues, conduct site visits, evaluate capacity and amenities, negotiate contracts, and secure venue booking with required deposits.",
+        "estimated_hours": 12,
+        "dependencies": (1,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Logistics"
+    },
+    {
+        "id": None,
+        "title": "Vendor Coordination & Services",
+        "description": "Source and book catering services, arrange AV equipment, hire photographers, coordinate with decorators, and confirm all service provider contracts.",
+        "estimated_hours": 16,
+        "dependencies": (2,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Logistics"
+    },
+    {
+        "id": None,
+        "title": "Guest Management & Invitations",
+        "description": "Compile guest list, design and send invitations (digital/physical), track RSVPs, manage dietary requirements, and arrange seating plan.",
+        "estimated_hours": 10,
+        "dependencies": (1,),
+        "deadline": None,
+        "priority": "Medium",
+        "category": "Communications"
+    },
+    {
+        "id": None,
+        "title": "Event Program & Schedule",
+        "description": "Create detailed event timeline, coordinate speakers or performers, prepare scripts or run sheets, and conduct final walkthroughs with all stakeholders.",
+        "estimated_hours": 8,
+        "dependencies": (2, 3),
+        "deadline": None,
+        "priority": "High",
+        "category": "Planning"
+    },
+    {
+        "id": None,
+        "title": "Event Execution & Management",
+        "description": "Oversee event setup, coordinate all vendors and staff, manage timeline execution, handle real-time issues, and ensure smooth event flow from start to finish.",
+        "estimated_hours": 12,
+        "dependencies": (3, 4, 5),
+        "deadline": None,
+        "priority": "High",
+        "category": "Execution"
+    },
+)
+
+_LEARNING_OFFSETS = ((2, 1/5), (6, 0.6), (10, 0.8), (0, 1.0))
+_LEARNING_TASKS = (
+    {
+        "id": None,
+        "title": "Foundation & Environment Setup for {subject}",
+        "description": "Install necessary software and tools, set up development environment, learn basic syntax and core concepts of {subject}, and complete beginner tutorials.",
+        "estimated_hours": 12,
+        "dependencies": (),
+        "deadline": None,
+        "priority": "High",
+        "category": "Learning"
+    },
+    {
+        "id": None,
+        "title": "Intermediate Concepts & Hands-on Practice",
+        "description": "Study intermediate {subject} concepts through structured courses, complete coding exercises and challenges, build small practice projects, and participate in coding communities.",
+        "estimated_hours": 24,
+        "dependencies": (1,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Learning"
+    },
+    {
+        "id": None,
+        "title": "Advanced Topics & Real-world Applications",
+        "description": "Explore advanced {subject} topics including best practices, design patterns, optimization techniques. Work on complex problems and study real-world code examples.",
+        "estimated_hours": 20,
+        "dependencies": (2,),
+        "deadline": None,
+        "priority": "Medium",
+        "category": "Practice"
+    },
+    {
+        "id": None,
+        "title": "Capstone Project & Portfolio Development",
+        "description": "Design and build a comprehensive {subject} project demonstrating learned skills. Document code, create README, deploy project, and add to professional portfolio.",
+        "estimated_hours": 16,
+        "dependencies": (3,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Portfolio"
+    },
+)
+
+_RESEARCH_OFFSETS = ((2, 1/4), (4, 1/3), (8, 0.65), (11, 0.85), (0, 1.0))
+_RESEARCH_TASKS = (
+    {
+        "id": None,
+        "title": "Topic Selection & Literature Review",
+        "description": "Define research question, conduct comprehensive literature review, identify gaps in existing research, and develop theoretical framework. Compile annotated bibliography.",
+        "estimated_hours": 20,
+        "dependencies": (),
+        "deadline": None,
+        "priority": "High",
+        "category": "Research"
+    },
+    {
+        "id": None,
+        "title": "Research Methodology Design",
+        "description": "Develop research methodology, design data collection instruments, establish sampling strategy, and prepare ethics approval documentation if required.",
+        "estimated_hours": 12,
+        "dependencies": (1,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Planning"
+    },
+    {
+        "id": None,
+        "title": "Data Collection & Analysis",
+        "description": "Execute data collection according to methodology, organize and clean data, perform statistical analysis, generate visualizations, and interpret results.",
+        "estimated_hours": 24,
+        "dependencies": (2,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Research"
+    },
+    {
+        "id": None,
+        "title": "Writing & Documentation",
+        "description": "Write research paper sections (introduction, methodology, results, discussion, conclusion), create tables and figures, ensure proper citations, and format according to requirements.",
+        "estimated_hours": 20,
+        "dependencies": (3,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Writing"
+    },
+    {
+        "id": None,
+        "title": "Review, Revision & Submission",
+        "description": "Proofread paper, incorporate peer feedback, verify citations and references, check formatting compliance, and submit final version before deadline.",
+        "estimated_hours": 12,
+        "dependencies": (4,),
+        "deadline": None,
+        "priority": "High",
+        "category": "Finalization"
+    },
+)
+
+# Phases for goals that match no specific pattern
+_PHASE_TEMPLATES = (
+    {
+        "name": "Planning & Requirements",
+        "description": "Define objectives, gather requirements, identify stakeholders, create project plan, and establish success criteria for: {goal}",
+        "category": "Planning"
+    },
+    {
+        "name": "Research & Preparation",
+        "description": "Conduct necessary research, gather resources, identify potential challenges, and prepare detailed approach for executing: {goal}",
+        "category": "Research"
+    },
+    {
+        "name": "Implementation Phase 1",
+        "description": "Begin core execution activities, establish foundations, implement initial components, and validate approach for: {goal}",
+        "category": "Development"
+    },
+    {
+        "name": "Implementation Phase 2",
+        "description": "Continue development work, integrate components, address identified issues, and complete majority of work for: {goal}",
+        "category": "Development"
+    },
+    {
+        "name": "Testing & Quality Assurance",
+        "description": "Conduct thorough testing, verify all requirements are met, identify and fix issues, and ensure quality standards for: {goal}",
+        "category": "Testing"
+    },
+    {
+        "name": "Finalization & Documentation",
+        "description": "Complete remaining tasks, create necessary documentation, prepare deliverables, and finalize all aspects of: {goal}",
+        "category": "Finalization"
+    },
+    {
+        "name": "Delivery & Completion",
+        "description": "Deliver final output, gather feedback, ensure stakeholder satisfaction, and officially close project for: {goal}",
+        "category": "Completion"
+    },
+)
+_PHASE_PRIORITIES = ("High", "High", "Medium", "High", "High", "Medium", "High")
+
+def _build_tasks(templates: Tuple[Dict[str, Any], ...], offsets: Tuple[Tuple[int, float], ...],
+                 start_date: datetime, total_days: int,
+                 subject: Optional[str] = None) -> List[Dict[str, Any]]:
+    '''Materialize a task template, formatting every deadline once'''
+    deadlines = [(start_date + timedelta(days=max(min_days, int(total_days * fraction)))).strftime("%Y-%m-%d")
+                 for min_days, fraction in offsets]
+
+    tasks = [
+        {**template, "id": i + 1, "deadline": deadlines[i], "dependencies": list(template["dependencies"])}
+        for i, template in enumerate(templates)
+    ]
+    if subject is not None:
+        for task in tasks:
+            task["title"] = task["title"].format(subject=subject)
+            task["description"] = task["description"].format(subject=subject)
+    return tasks
+
+def fallback_plan_generation(goal: str, start_date: datetime) -> Dict[str, Any]:
+    '''Enhanced rule-based plan generation with intelligent task breakdown'''
+
+    total_days = extract_timeframe(goal)
+    end_date = start_date + timedelta(days=total_days)
+
+    category, subject_word = _classify_goal(goal.lower())
+    tasks: List[Dict[str, Any]] = []
+
+    # Product/App Launch Pattern
+    if category == 'product_app':
+        tasks = _build_tasks(_PRODUCT_TASKS, _PRODUCT_OFFSETS, start_date, total_days)
+
+    # Event Organization Pattern
+    elif category == 'event':
+        tasks = _build_tasks(_EVENT_TASKS, _EVENT_OFFSETS, start_date, total_days)
+
+    # Learning/Education Pattern
+    elif category == 'learning':
+        subject = subject_word.capitalize() if subject_word else "the subject"
+        tasks = _build_tasks(_LEARNING_TASKS, _LEARNING_OFFSETS, start_date, total_days, subject)
+
+    # Research/Academic Pattern
+    elif category == 'research':
+        tasks = _build_tasks(_RESEARCH_TASKS, _RESEARCH_OFFSETS, start_date, total_days)
+
+    # Generic Pattern for other goals
+    else:
+        num_tasks = max(4, min(7, total_days // 3))
+        task_duration = total_days / num_tasks
+
+        deadlines = [(start_date + timedelta(days=int(i * task_duration))).strftime("%Y-%m-%d")
+                     for i in range(num_tasks)]
+
+        tasks = [
+            {
+                "id": i + 1,
+                "title": phase["name"],
+                "description": phase["description"].format(goal=goal),
+                "estimated_hours": 10 + (i % 3) * 6,
+                "dependencies": [i] if i > 0 else [],
+                "deadline": deadlines[i],
+                "priority": _PHASE_PRIORITIES[i],
+                "category": phase["category"]
+            }
+            for i, phase in enumerate(_PHASE_TEMPLATES[:num_tasks])
+        ]
+
+    # Task ids are always 1..n, so milestone task lists are plain ranges
+    num_tasks = len(tasks)
+    start_str = start_date.strftime("%Y-%m-%d")
+    end_str = end_date.strftime("%Y-%m-%d")
+
+    # Create meaningful milestones
+    milestones: List[Dict[str, Any]] = [
+        {
+            "name": "Project Kickoff & Planning Complete",
+            "date": start_str,
+            "tasks_completed": []
+        }
+    ]
+
+    if num_tasks > 3:
+        third_point = num_tasks // 3
+        two_third_point = (num_tasks * 2) // 3
+
+        milestones.append({
+            "name": "Initial Phase Complete",
+            "date": (start_date + timedelta(days=total_days//3)).strftime("%Y-%m-%d"),
+            "tasks_completed": list(range(1, third_point + 1))
+        })
+
+        milestones.append({
+            "name": "Development Phase Complete",
+            "date": (start_date + timedelta(days=(total_days*2)//3)).strftime("%Y-%m-%d"),
+            "tasks_completed": list(range(1, two_third_point + 1))
+        })
+
+    milestones.append({
+        "name": "Project Completion & Delivery",
+        "date": end_str,
+        "tasks_completed": list(range(1, num_tasks + 1))
+    })
+
+    return {
+        "goal": goal,
+        "estimated_duration": f"{total_days} days",
+        "tasks": tasks,
+        "timeline": {
+            "start_date": start_str,
+            "end_date": end_str,
+            "milestones": milestones
+        }
+    }
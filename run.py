@@ -5,15 +5,78 @@ Supports LLM integration and provides comprehensive startup options
 """
 
 import subprocess
+import importlib.util
 import sys
 import os
 import time
 
+# check_llm_status results are reused for this many seconds
+LLM_STATUS_TTL = 30
+_LLM_STATUS_CACHE = {"ts": None, "val": None}
+
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+# (connect, read) seconds; a local server that is up accepts almost instantly
+OLLAMA_PROBE_TIMEOUT = (0.5, 2)
+_HTTP_SESSION = None
+
+BANNER = """\
+==================================================
+     SMART TASK PLANNER
+    Enhanced LLM Version
+==================================================
+"""
+
+HELP_TEXT = """
+Smart Task Planner Help
+========================================
+
+What is Smart Task Planner?
+An AI-powered application that breaks down your goals into actionable
+tasks with timelines, dependencies, and milestones using LLM reasoning.
+
+Quick Start:
+1. Make sure you have Python 3.7+ installed
+2. Install dependencies: pip install -r requirements.txt
+3. Run this script: python run.py
+4. Choose option 1 to start the web app
+5. Open http://localhost:5000 in your browser
+
+Project Files:
+- app.py: Main Flask application with LLM integration
+- planner_core.py: Rule-based planner (compile with setup.py)
+- plan_cache.py: Goal and semantic caches for LLM plans
+- templates/index.html: Advanced web interface
+- requirements.txt: Python dependencies
+- demo.py: Interactive command-line demo
+- test_api.py: API testing script
+- README.md: Comprehensive documentation
+
+LLM Integration:
+- Ollama (Best): Natural AI reasoning with local models
+- HuggingFace (Good): Transformer models with local processing
+- Fallback (Basic): Enhanced rule-based intelligent generation
+
+Example Goals to Try:
+- 'Launch a mobile app in 3 weeks'
+- 'Learn Python programming in 1 month'
+- 'Organize a team building event in 10 days'
+- 'Complete a research paper in 2 weeks'
+- 'Plan a wedding in 6 months'
+
+Troubleshooting:
+- Check system status (option 4)
+- Try quick launch (option 7)
+- Install minimal: pip install "Flask[async]==2.3.3" orjson
+- Check SETUP_GUIDE.md for detailed help"""
+
 def check_dependencies():
     """Check if required packages are installed"""
     required_packages = {
-        'flask': 'Flask==2.3.3',
-        'flask_cors': 'flask-cors==4.0.0'
+        'flask': 'Flask[async]==2.3.3',
+        # The API views are async; Flask needs its async extra to run them
+        'asgiref': 'Flask[async]==2.3.3',
+        'flask_cors': 'flask-cors==4.0.0',
+        'orjson': 'orjson>=3.9.0'
     }
 
     optional_packages = {
@@ -25,55 +88,71 @@ def check_dependencies():
     missing_required = []
     missing_optional = []
 
+    # find_spec only locates the packages; importing torch and transformers
+    # here would add seconds to every launch
     for package, version in required_packages.items():
-        try:
-            if package == 'flask_cors':
-                import flask_cors
-            else:
-                __import__(package)
-        except ImportError:
+        if importlib.util.find_spec(package) is None and version not in missing_required:
             missing_required.append(version)
 
     for package, version in optional_packages.items():
-        try:
-            __import__(package)
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             missing_optional.append(version)
 
     return missing_required, missing_optional
 
+def _http_session():
+    """Shared requests session for talking to Ollama, created on first use"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        _HTTP_SESSION = requests.Session()
+    return _HTTP_SESSION
+
 def check_llm_status():
-    """Check available LLM methods"""
+    """Check available LLM methods, reusing the last result for LLM_STATUS_TTL seconds"""
+    # monotonic, so a system clock change cannot keep a stale result alive
+    if _LLM_STATUS_CACHE["ts"] is not None and time.monotonic() - _LLM_STATUS_CACHE["ts"] < LLM_STATUS_TTL:
+        return _LLM_STATUS_CACHE["val"]
+
     llm_status = {
         'ollama': False,
+        'ollama_models': [],
         'transformers': False,
         'fallback': True
     }
 
-    # Check Ollama
+    # Check Ollama; the same response lists the installed models
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=2)
-        llm_status['ollama'] = response.status_code == 200
-    except:
+        response = _http_session().get(OLLAMA_TAGS_URL, timeout=OLLAMA_PROBE_TIMEOUT)
+        if response.status_code == 200:
+            llm_status['ollama'] = True
+            llm_status['ollama_models'] = response.json().get('models') or []
+    except Exception:
         pass
 
-    # Check Transformers
-    try:
-        import transformers
-        import torch
-        llm_status['transformers'] = True
-    except:
-        pass
+    # Check Transformers; find_spec avoids the multi-second import
+    llm_status['transformers'] = bool(importlib.util.find_spec("transformers")
+                                      and importlib.util.find_spec("torch"))
 
+    _LLM_STATUS_CACHE["ts"] = time.monotonic()
+    _LLM_STATUS_CACHE["val"] = llm_status
     return llm_status
 
 def print_banner():
-    print("="*50)
-    print("     SMART TASK PLANNER")
-    print("    Enhanced LLM Version")
-    print("="*50)
-    print()
+    print(BANNER)
+
+def run_script(script):
+    """Run one of the project scripts; the menu exits once it finishes"""
+    if not os.path.exists(script):
+        raise FileNotFoundError(script)
+
+    if os.name == 'posix':
+        # Nothing runs after the script, so hand this process over to it
+        # instead of keeping a second interpreter alive alongside it
+        sys.stdout.flush()
+        os.execvp(sys.executable, [sys.executable, script])
+
+    subprocess.run([sys.executable, script])
 
 def print_llm_status():
     print("AI/LLM Status Check:")
@@ -83,15 +162,10 @@ def print_llm_status():
 
     if llm_status['ollama']:
         print("[OK] Ollama: Available (Best Quality)")
-        try:
-            import requests
-            models = requests.get("http://localhost:11434/api/tags").json()
-            if models.get('models'):
-                print(f"   Models: {len(models['models'])} installed")
-            else:
-                print("   [WARNING] No models found. Run: ollama pull llama2")
-        except:
-            print("   [WARNING] Connection issues")
+        if llm_status['ollama_models']:
+            print(f"   Models: {len(llm_status['ollama_models'])} installed")
+        else:
+            print("   [WARNING] No models found. Run: ollama pull llama2")
     else:
         print("[INFO] Ollama: Not available")
         print("   To install: https://ollama.ai")
@@ -114,7 +188,7 @@ def print_llm_status():
     print("   Enhanced rule-based task generation")
     print()
 
-def main():
+def main(warmup=False):
     print_banner()
 
     missing_required, missing_optional = check_dependencies()
@@ -124,7 +198,7 @@ def main():
         for package in missing_required:
             print(f"   - {package}")
         print("\nInstall with: pip install -r requirements.txt")
-        print("Or minimal install: pip install Flask==2.3.3")
+        print("Or minimal install: pip install \"Flask[async]==2.3.3\" orjson")
         return
 
     print("[OK] Core dependencies satisfied!")
@@ -151,14 +225,23 @@ def main():
         choice = input("\nEnter your choice (1-7): ").strip()
 
         if choice == '1':
+            # Benchmark mode serves with waitress: no reloader or debugger
+            # adding overhead to every request test_api.py measures
+            benchmark = input("Benchmark mode (waitress, no debugger)? [y/N]: ").strip().lower() == 'y'
+
             print("\nStarting web application...")
             print("Application will be available at: http://localhost:5000")
             print("LLM method will be auto-detected and displayed")
             print("Press Ctrl+C to stop the server")
             print("-" * 50)
             try:
-                from app import app
-                app.run(debug=True, host='0.0.0.0', port=5000)
+                from app import app, planner, serve_production
+                if warmup:
+                    planner.warmup()
+                if benchmark:
+                    serve_production()
+                else:
+                    app.run(debug=True, host='0.0.0.0', port=5000)
             except KeyboardInterrupt:
                 print("\n\nServer stopped. Goodbye!")
             except ImportError as e:
@@ -171,7 +254,7 @@ def main():
             print("[WARNING] Make sure the web app is running in another terminal!")
             input("Press Enter when ready, or Ctrl+C to cancel...")
             try:
-                subprocess.run([sys.executable, 'test_api.py'])
+                run_script('test_api.py')
             except FileNotFoundError:
                 print("[ERROR] test_api.py not found")
             except KeyboardInterrupt:
@@ -181,7 +264,7 @@ def main():
         elif choice == '3':
             print("\nStarting interactive demo...")
             try:
-                subprocess.run([sys.executable, 'demo.py'])
+                run_script('demo.py')
             except FileNotFoundError:
                 print("[ERROR] demo.py not found")
             break
@@ -265,11 +348,13 @@ def main():
             print("\nQuick Launch (minimal dependencies)...")
             try:
                 import flask
-                from app import app
+                from app import app, planner
+                if warmup:
+                    planner.warmup()
                 print("[OK] Starting with basic features...")
                 app.run(debug=False, host='127.0.0.1', port=5000)
             except ImportError:
-                print("[ERROR] Flask not installed. Run: pip install Flask==2.3.3")
+                print("[ERROR] Flask not installed. Run: pip install \"Flask[async]==2.3.3\" orjson")
             except Exception as e:
                 print(f"[ERROR]: {e}")
             break
@@ -278,50 +363,14 @@ def main():
             print("[ERROR] Invalid choice. Please select 1-7.")
 
 def show_help():
-    print("\nSmart Task Planner Help")
-    print("=" * 40)
-    print("\nWhat is Smart Task Planner?")
-    print("An AI-powered application that breaks down your goals into actionable")
-    print("tasks with timelines, dependencies, and milestones using LLM reasoning.")
-
-    print("\nQuick Start:")
-    print("1. Make sure you have Python 3.7+ installed")
-    print("2. Install dependencies: pip install -r requirements.txt")
-    print("3. Run this script: python run.py")
-    print("4. Choose option 1 to start the web app")
-    print("5. Open http://localhost:5000 in your browser")
-
-    print("\nProject Files:")
-    print("- app.py: Main Flask application with LLM integration")
-    print("- templates/index.html: Advanced web interface")
-    print("- requirements.txt: Python dependencies")
-    print("- demo.py: Interactive command-line demo")
-    print("- test_api.py: API testing script")
-    print("- README.md: Comprehensive documentation")
-
-    print("\nLLM Integration:")
-    print("- Ollama (Best): Natural AI reasoning with local models")
-    print("- HuggingFace (Good): Transformer models with local processing")
-    print("- Fallback (Basic): Enhanced rule-based intelligent generation")
-
-    print("\nExample Goals to Try:")
-    print("- 'Launch a mobile app in 3 weeks'")
-    print("- 'Learn Python programming in 1 month'")
-    print("- 'Organize a team building event in 10 days'")
-    print("- 'Complete a research paper in 2 weeks'")
-    print("- 'Plan a wedding in 6 months'")
-
-    print("\nTroubleshooting:")
-    print("- Check system status (option 4)")
-    print("- Try quick launch (option 7)")
-    print("- Install minimal: pip install Flask==2.3.3")
-    print("- Check SETUP_GUIDE.md for detailed help")
+    print(HELP_TEXT)
 
     input("\nPress Enter to return to menu...")
 
 if __name__ == "__main__":
     try:
-        main()
+        # --warmup loads the LLM before the server starts (options 1 and 7)
+        main(warmup='--warmup' in sys.argv[1:])
     except KeyboardInterrupt:
         print("\n\nGoodbye!")
     except Exception as e:
@@ -0,0 +1,19 @@
+"""
+Smart Task Planner - Optional Native Build
+Compiles the rule-based planner core with mypyc:
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+The app imports the compiled planner_core extension when it is present and
+the plain planner_core.py otherwise.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='smart-task-planner-core',
+    py_modules=['planner_core'],
+    ext_modules=mypycify(['planner_core.py']),
+)
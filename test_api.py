@@ -5,11 +5,16 @@ Comprehensive testing of LLM integration and API functionality
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 import time
 import sys
 from datetime import datetime
 
+# Bodies at least this large are read straight from the socket into orjson
+STREAM_MIN_BYTES = 16 * 1024
+
 def print_banner():
     print("="*60)
     print("     SMART TASK PLANNER - API TEST SUITE")
@@ -17,13 +22,13 @@ def print_banner():
     print("="*60)
     print()
 
-def test_server_connection(base_url):
+def test_server_connection(session, base_url):
     """Test basic server connectivity"""
     print("[TEST] Testing Server Connection...")
     try:
-        response = requests.get(f"{base_url}/api/health", timeout=5)
+        response = session.get(f"{base_url}/api/health", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"[PASS] Server is running: {data.get('status', 'unknown')}")
             print(f"[INFO] Timestamp: {data.get('timestamp', 'unknown')}")
             if 'llm_method' in data:
@@ -46,13 +51,13 @@ def test_server_connection(base_url):
         print(f"[FAIL] Connection error: {e}")
         return False
 
-def test_llm_status(base_url):
+def test_llm_status(session, base_url):
     """Test LLM status endpoint"""
     print("\n[TEST] Testing LLM Status...")
     try:
-        response = requests.get(f"{base_url}/api/llm-status", timeout=5)
+        response = session.get(f"{base_url}/api/llm-status", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
 
             current_method = data.get('current_method', 'unknown')
             available_methods = data.get('available_methods', {})
@@ -74,7 +79,28 @@ def test_llm_status(base_url):
         print(f"[FAIL] LLM status error: {e}")
         return None, {}
 
-def test_plan_generation(base_url):
+def read_body(response):
+    """Read a streamed response body once and release its connection"""
+    with response:
+        if int(response.headers.get("Content-Length") or 0) >= STREAM_MIN_BYTES:
+            return response.raw.read(decode_content=True)
+        return response.content
+
+def post_plan(session, base_url, goal):
+    """Request a plan for one goal, returning the response, its body and the round-trip time"""
+    start_time = time.perf_counter()
+
+    response = session.post(
+        f"{base_url}/api/plan",
+        json={"goal": goal},
+        stream=True,
+        timeout=60
+    )
+    body = read_body(response)
+
+    return response, body, time.perf_counter() - start_time
+
+def test_plan_generation(session, base_url):
     """Test plan generation functionality"""
     print("\n[TEST] Testing Plan Generation...")
 
@@ -87,46 +113,45 @@ def test_plan_generation(base_url):
     successful_tests = 0
     plan_ids = []
 
-    for i, goal in enumerate(test_goals, 1):
-        print(f"\n  Test {i}/{len(test_goals)}: '{goal}'")
-
-        try:
-            start_time = time.time()
-
-            response = requests.post(
-                f"{base_url}/api/plan",
-                json={"goal": goal},
-                headers={"Content-Type": "application/json"},
-                timeout=60
-            )
-
-            end_time = time.time()
-            processing_time = end_time - start_time
-
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    plan = data['plan']
-                    plan_ids.append(plan['id'])
-
-                    tasks = plan.get('tasks', [])
-                    milestones = plan.get('timeline', {}).get('milestones', [])
-
-                    print(f"    [PASS] Generated successfully ({processing_time:.2f}s)")
-                    print(f"    [INFO] Tasks: {len(tasks)}")
-                    print(f"    [INFO] Milestones: {len(milestones)}")
-                    print(f"    [INFO] Method: {data.get('llm_method', 'unknown').upper()}")
-
-                    successful_tests += 1
+    # The goals are independent, so all requests run at once and the test
+    # takes about as long as the slowest plan; results print as they finish
+    with ThreadPoolExecutor(max_workers=len(test_goals)) as executor:
+        futures = {
+            executor.submit(post_plan, session, base_url, goal): (i, goal)
+            for i, goal in enumerate(test_goals, 1)
+        }
+
+        for future in as_completed(futures):
+            i, goal = futures[future]
+            print(f"\n  Test {i}/{len(test_goals)}: '{goal}'")
+
+            try:
+                response, body, processing_time = future.result()
+
+                if response.status_code == 200:
+                    data = orjson.loads(body)
+                    if data.get('success'):
+                        plan = data['plan']
+                        plan_ids.append(plan['id'])
+
+                        tasks = plan.get('tasks', [])
+                        milestones = plan.get('timeline', {}).get('milestones', [])
+
+                        print(f"    [PASS] Generated successfully ({processing_time:.2f}s)")
+                        print(f"    [INFO] Tasks: {len(tasks)}")
+                        print(f"    [INFO] Milestones: {len(milestones)}")
+                        print(f"    [INFO] Method: {data.get('llm_method', 'unknown').upper()}")
+
+                        successful_tests += 1
+                    else:
+                        print(f"    [FAIL] Generation failed: {data.get('error', 'unknown')}")
                 else:
-                    print(f"    [FAIL] Generation failed: {data.get('error', 'unknown')}")
-            else:
-                print(f"    [FAIL] Request failed: HTTP {response.status_code}")
+                    print(f"    [FAIL] Request failed: HTTP {response.status_code}")
 
-        except requests.exceptions.Timeout:
-            print(f"    [FAIL] Request timeout (>60s)")
-        except Exception as e:
-            print(f"    [FAIL] Request error: {e}")
+            except requests.exceptions.Timeout:
+                print(f"    [FAIL] Request timeout (>60s)")
+            except Exception as e:
+                print(f"    [FAIL] Request error: {e}")
 
     success_rate = (successful_tests / len(test_goals)) * 100
     print(f"\n[SUMMARY] Plan Generation Results:")
@@ -134,7 +159,7 @@ def test_plan_generation(base_url):
 
     return plan_ids
 
-def test_plan_retrieval(base_url, plan_ids):
+def test_plan_retrieval(session, base_url, plan_ids):
     """Test plan retrieval functionality"""
     print("\n[TEST] Testing Plan Retrieval...")
 
@@ -146,10 +171,11 @@ def test_plan_retrieval(base_url, plan_ids):
 
     for plan_id in plan_ids[:2]:
         try:
-            response = requests.get(f"{base_url}/api/plan/{plan_id}", timeout=10)
+            response = session.get(f"{base_url}/api/plan/{plan_id}", stream=True, timeout=10)
+            body = read_body(response)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(body)
                 if data.get('success'):
                     plan = data['plan']
                     print(f"    [PASS] Retrieved plan {plan_id}")
@@ -165,16 +191,43 @@ def test_plan_retrieval(base_url, plan_ids):
 
     print(f"\n[SUMMARY] Retrieval Results: {successful_retrievals}/{min(len(plan_ids), 2)} successful")
 
-def test_error_handling(base_url):
+def test_batch_generation(session, base_url):
+    """Test the batch plan endpoint"""
+    print("\n[TEST] Testing Batch Plan Generation...")
+
+    goals = [
+        "Plan a product launch in 2 weeks",
+        "Study for a certification in 1 month"
+    ]
+
+    try:
+        start_time = time.perf_counter()
+        response = session.post(f"{base_url}/api/plan/batch", json={"goals": goals}, stream=True, timeout=120)
+        body = read_body(response)
+        processing_time = time.perf_counter() - start_time
+
+        if response.status_code == 200:
+            data = orjson.loads(body)
+            plans = data.get('plans', [])
+            if data.get('success') and len(plans) == len(goals):
+                print(f"    [PASS] Generated {len(plans)} plans in one request ({processing_time:.2f}s)")
+                print(f"    [INFO] Plan IDs: {', '.join(str(plan['id']) for plan in plans)}")
+            else:
+                print(f"    [FAIL] Expected {len(goals)} plans, got {len(plans)}: {data.get('error', 'unknown')}")
+        else:
+            print(f"    [FAIL] Request failed: HTTP {response.status_code}")
+    except Exception as e:
+        print(f"    [FAIL] Batch request error: {e}")
+
+def test_error_handling(session, base_url):
     """Test API error handling"""
     print("\n[TEST] Testing Error Handling...")
 
     # Test empty goal
     try:
-        response = requests.post(
+        response = session.post(
             f"{base_url}/api/plan",
             json={"goal": ""},
-            headers={"Content-Type": "application/json"},
             timeout=10
         )
         if response.status_code == 400:
@@ -184,9 +237,21 @@ def test_error_handling(base_url):
     except Exception as e:
         print(f"    [FAIL] Empty goal test: {e}")
 
+    # Test invalid batch input: a string is not a list of goals, and every
+    # goal must be a non-empty string
+    for payload in ({"goals": "abc"}, {"goals": []}, {"goals": [None, {"a": 1}]}, {"goals": ["ok", "  "]}):
+        try:
+            response = session.post(f"{base_url}/api/plan/batch", json=payload, timeout=10)
+            if response.status_code == 400:
+                print(f"    [PASS] Invalid batch rejected: {orjson.dumps(payload).decode()}")
+            else:
+                print(f"    [WARN] Expected 400 for {orjson.dumps(payload).decode()}, got {response.status_code}")
+        except Exception as e:
+            print(f"    [FAIL] Invalid batch test: {e}")
+
     # Test non-existent plan
     try:
-        response = requests.get(f"{base_url}/api/plan/99999", timeout=10)
+        response = session.get(f"{base_url}/api/plan/99999", timeout=10)
         if response.status_code == 404:
             print("    [PASS] Non-existent plan handling working")
         else:
@@ -203,14 +268,20 @@ def run_comprehensive_tests():
     print("Smart Task Planner API Test Suite")
     print("Testing LLM integration and API functionality\n")
 
-    if not test_server_connection(base_url):
-        print("\n[ERROR] Cannot continue testing without server connection")
-        return
+    # One pooled session for the whole suite, so requests reuse connections
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=0))
+        session.headers.update({"Content-Type": "application/json"})
+
+        if not test_server_connection(session, base_url):
+            print("\n[ERROR] Cannot continue testing without server connection")
+            return
 
-    current_llm, available_methods = test_llm_status(base_url)
-    plan_ids = test_plan_generation(base_url)
-    test_plan_retrieval(base_url, plan_ids)
-    test_error_handling(base_url)
+        current_llm, available_methods = test_llm_status(session, base_url)
+        plan_ids = test_plan_generation(session, base_url)
+        test_plan_retrieval(session, base_url, plan_ids)
+        test_batch_generation(session, base_url)
+        test_error_handling(session, base_url)
 
     print("\n" + "="*80)
     print("COMPREHENSIVE API TESTING COMPLETED")